@@ -25,55 +25,55 @@ activities = {
         "description": "Join the basketball team and compete in local tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Soccer Club": {
         "description": "Practice soccer skills and participate in matches",
         "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Art Club": {
         "description": "Explore various art techniques and create projects",
         "schedule": "Fridays, 3:00 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": []
+        "participants": set()
     },
     "Drama Club": {
         "description": "Participate in theater productions and improve acting skills",
         "schedule": "Mondays, 3:30 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Debate Team": {
         "description": "Engage in debates and improve public speaking skills",
         "schedule": "Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 12,
-        "participants": []
+        "participants": set()
     },
     "Math Club": {
         "description": "Solve challenging math problems and participate in competitions",
         "schedule": "Wednesdays, 3:00 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -84,12 +84,17 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities():
+    # Participants are stored as sets; return them as sorted lists so the
+    # response is deterministic
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -102,13 +107,17 @@ def signup_for_activity(activity_name: str, email: str):
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
+    # Validate activity is not full
+    if len(activity["participants"]) >= activity["max_participants"]:
+        raise HTTPException(status_code=400, detail="Activity is full")
+
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/participants")
-def unregister_participant(activity_name: str, email: str):
+async def unregister_participant(activity_name: str, email: str):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
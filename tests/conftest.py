@@ -1,21 +1,87 @@
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from src.app import app
+from src.app import app, activities
 
 
-@pytest.fixture
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Mark tests that do not reset participants as read-only"""
+    # Runs before the -m filter so "pytest -m readonly" selects them
+    for item in items:
+        if "reset_participants" not in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.readonly)
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Fixture providing a test client for the FastAPI app"""
-    return TestClient(app)
+    """Fixture providing a test client for the FastAPI app, shared across the session"""
+    # Entering the client keeps one event loop portal open for the whole
+    # session instead of starting a new one for every request
+    with TestClient(app, headers={"Accept": "application/json"}) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Fixture providing an async client that calls the ASGI app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"Accept": "application/json"},
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture(scope="module")
+def baseline_activities(client):
+    """Fixture fetching GET /activities once per module for read-only tests"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+def _route_paths(route_name):
+    """Build the path of the given route for every activity"""
+    return {name: app.url_path_for(route_name, activity_name=name) for name in activities}
+
+
+@pytest.fixture(scope="session")
+def signup_urls():
+    """Fixture mapping each activity name to its signup path"""
+    return _route_paths("signup_for_activity")
+
+
+@pytest.fixture(scope="session")
+def unregister_urls():
+    """Fixture mapping each activity name to its unregister path"""
+    return _route_paths("unregister_participant")
+
+
+@pytest.fixture(scope="session")
+def _activities_snapshot():
+    """Fixture capturing the seeded participants of every activity once per session"""
+    return {name: set(details["participants"]) for name, details in activities.items()}
+
+
+@pytest.fixture
+def reset_participants(_activities_snapshot):
+    """Fixture to restore the seeded participants after each test (opt-in)"""
+    yield
+    # Restore seeded participants after test
+    for name, seeded in _activities_snapshot.items():
+        participants = activities[name]["participants"]
+        participants.clear()
+        participants.update(seeded)
 
 
 @pytest.fixture
-def reset_participants():
-    """Fixture to reset participants between tests (opt-in)"""
-    from src.app import activities
-    for activity in activities.values():
-        activity["participants"] = []
+def math_club_nearly_full(reset_participants):
+    """Fixture seeding Math Club directly so it has exactly one spot left"""
+    activity = activities["Math Club"]
+    activity["participants"].update(
+        f"student{i}@mergington.edu" for i in range(activity["max_participants"] - 1)
+    )
     yield
-    # Clean up after test
-    for activity in activities.values():
-        activity["participants"] = []